@@ -8,15 +8,10 @@ import MQTTInspector from './MQTTInspector';
 import CombinedChart from './CombinedChart';
 import SensorChart from './SensorChart';
 import AirQualityBar from './AirQualityBar';
-import TemperatureGauge from './TemperatureGauge';
-import HumidityGauge from './HumidityGauge';
-import CO2Gauge from './CO2Gauge';
-import TVOCGauge from './TVOCGauge';
-import TemperatureChart from './TemperatureChart';
-import HumidityChart from './HumidityChart';
-import CO2Chart from './CO2Chart';
-import TVOCChart from './TVOCChart';
+import MetricGauge from './MetricGauge';
+import MetricChart from './MetricChart';
 import { useMQTT } from '../contexts/MQTTContext';
+import { generateDummyData } from '../utils/dummyData';
 
 interface CanvasProps {
   widgets: BaseWidget[];
@@ -93,36 +88,27 @@ const renderWidget = (w: BaseWidget, currentSensorValues: { temperature: number;
       );
     // New dedicated gauge components
     case 'temperatureGauge':
-      return <TemperatureGauge />;
+      return <MetricGauge metric="temperature" />;
     case 'humidityGauge':
-      return <HumidityGauge />;
+      return <MetricGauge metric="humidity" />;
     case 'co2Gauge':
-      return <CO2Gauge />;
+      return <MetricGauge metric="co2" />;
     case 'tvocGauge':
-      return <TVOCGauge />;
+      return <MetricGauge metric="tvoc" />;
     // New dedicated chart components
     case 'temperatureChart':
-      return <TemperatureChart />;
+      return <MetricChart metric="temperature" />;
     case 'humidityChart':
-      return <HumidityChart />;
+      return <MetricChart metric="humidity" />;
     case 'co2Chart':
-      return <CO2Chart />;
+      return <MetricChart metric="co2" />;
     case 'tvocChart':
-      return <TVOCChart />;
+      return <MetricChart metric="tvoc" />;
     default:
       return null;
   }
 };
 
-function generateDummyData(baseValue: number, range: number, count: number) {
-  const data = [] as Array<{ timestamp: Date; value: number }>;
-  let currentDate = new Date();
-  for (let i = count - 1; i >= 0; i--) {
-    data.push({ timestamp: new Date(currentDate.getTime() - i * 60000), value: baseValue + (Math.random() - 0.5) * range });
-  }
-  return data;
-}
-
 const Canvas: React.FC<CanvasProps> = ({ widgets, onChange, onSelect }) => {
   const [dragId, setDragId] = React.useState<string | null>(null);
   const [offset, setOffset] = React.useState<{x: number; y: number}>({ x: 0, y: 0 });
@@ -18,7 +18,7 @@ const MQTTInspector: React.FC = () => {
         )}
         {messageLog.map((m, idx) => (
           <ListItem key={idx} divider>
-            <ListItemText primary={m.topic} secondary={`${m.payload} — ${new Date(m.receivedAt).toLocaleTimeString()}`} />
+            <ListItemText primary={m.topic} secondary={`${m.payload} — ${m.receivedAt.toLocaleTimeString()}`} />
           </ListItem>
         ))}
       </List>
@@ -0,0 +1,47 @@
+import React from 'react';
+import { Box, Paper, Typography } from '@mui/material';
+import SensorChart from './SensorChart';
+import { SensorMetric, useMQTT } from '../contexts/MQTTContext';
+import { SENSOR_METRICS, formatWithUnit } from '../utils/sensorMetrics';
+import { generateDummyData } from '../utils/dummyData';
+
+interface MetricChartProps {
+  metric: SensorMetric;
+}
+
+const MetricChart: React.FC<MetricChartProps> = ({ metric }) => {
+  const { sensorData, currentSensorValues } = useMQTT();
+  const spec = SENSOR_METRICS[metric];
+  const { title, icon, unit, chart } = spec;
+  
+  // Use real-time data if available, otherwise show dummy data
+  const chartData = sensorData[metric].length > 0 
+    ? sensorData[metric] 
+    : generateDummyData(currentSensorValues[metric] || chart.fallbackValue, chart.dummyRange, 20);
+
+  return (
+    <Paper sx={{ p: 2 }}>
+      <Typography variant="h6" gutterBottom sx={{ fontWeight: 600 }}>
+        {icon} {title} Chart
+      </Typography>
+      <Typography variant="caption" color="text.secondary" sx={{ display: 'block', mb: 2 }}>
+        Realtime - last 5 minutes
+      </Typography>
+      
+      <Box sx={{ height: 300 }}>
+        <SensorChart
+          title={title}
+          data={chartData}
+          color={chart.color}
+          unit={unit}
+        />
+      </Box>
+      
+      <Typography variant="caption" sx={{ display: 'block', mt: 1, color: 'text.secondary' }}>
+        Debug: Data points: {chartData.length}, Current: {formatWithUnit(currentSensorValues[metric] || 0, spec)}
+      </Typography>
+    </Paper>
+  );
+};
+
+export default MetricChart;
@@ -1,7 +1,8 @@
 import React from 'react';
 import { Box, Paper, Typography } from '@mui/material';
 import { styled } from '@mui/material/styles';
-import { useMQTT } from '../contexts/MQTTContext';
+import { SensorMetric, useMQTT } from '../contexts/MQTTContext';
+import { SENSOR_METRICS, formatRange, formatWithUnit } from '../utils/sensorMetrics';
 
 const GaugeContainer = styled(Box)(({ theme }) => ({
   position: 'relative',
@@ -43,43 +44,49 @@ const ValueContainer = styled(Box)({
   zIndex: 2,
 });
 
-const TVOCGauge: React.FC = () => {
+interface MetricGaugeProps {
+  metric: SensorMetric;
+}
+
+const MetricGauge: React.FC<MetricGaugeProps> = ({ metric }) => {
   const { currentSensorValues } = useMQTT();
+  const spec = SENSOR_METRICS[metric];
+  const { title, icon, unit, gauge } = spec;
   
-  const value = currentSensorValues.tvoc || 0;
-  const min = 0;
-  const max = 2;
+  const value = currentSensorValues[metric] || 0;
+  const { min, max } = gauge;
   const progress = Math.max(0, Math.min(100, ((value - min) / (max - min)) * 100));
-  const color = value < 0.3 ? '#4caf50' : value > 1.0 ? '#f44336' : '#ff9800';
+  const [low, high] = gauge.thresholds;
+  const color = value < low ? gauge.colors[0] : value > high ? gauge.colors[2] : gauge.colors[1];
 
   return (
     <Paper sx={{ p: 2, textAlign: 'center' }}>
       <Typography variant="h6" gutterBottom sx={{ fontWeight: 600 }}>
-        🧪 TVOC
+        {icon} {title}
       </Typography>
       
       <GaugeContainer>
         <GaugeCircle color={color} progress={progress}>
           <ValueContainer>
             <Typography variant="h4" sx={{ fontWeight: 'bold', color: color, lineHeight: 1 }}>
-              {value.toFixed(3)}
+              {value.toFixed(gauge.decimals)}
             </Typography>
             <Typography variant="body2" sx={{ color: 'text.secondary', mt: 0.5 }}>
-              ppm
+              {unit}
             </Typography>
           </ValueContainer>
         </GaugeCircle>
       </GaugeContainer>
       
       <Typography variant="body2" sx={{ mt: 2, color: 'text.secondary' }}>
-        Range: {min} - {max} ppm
+        Range: {formatRange(min, max, spec)}
       </Typography>
       
       <Typography variant="caption" sx={{ display: 'block', mt: 1, color: 'text.secondary' }}>
-        Debug: {value} ppm
+        Debug: {formatWithUnit(value, spec)}
       </Typography>
     </Paper>
   );
 };
 
-export default TVOCGauge;
+export default MetricGauge;
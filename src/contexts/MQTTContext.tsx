@@ -1,5 +1,12 @@
 import React, { createContext, useContext, useEffect, useState } from 'react';
 import mqtt, { MqttClient } from 'mqtt';
+import { isSensorMetric } from '../utils/sensorMetrics';
+
+// Per-message console logging is noisy and costly at high message rates; opt in with REACT_APP_MQTT_DEBUG=true
+const MQTT_DEBUG = process.env.REACT_APP_MQTT_DEBUG === 'true';
+
+// Legacy office/{room}/{device}/{subtopic} subtopics that report device state
+const DEVICE_STATE_SUBTOPICS: ReadonlySet<string> = new Set(['set', 'control', 'state', 'status']);
 
 interface MQTTContextType {
   client: MqttClient | null;
@@ -33,6 +40,8 @@ interface MQTTContextType {
   };
 }
 
+export type SensorMetric = keyof MQTTContextType['currentSensorValues'];
+
 const MQTTContext = createContext<MQTTContextType>({
   client: null,
   isConnected: false,
@@ -138,104 +147,99 @@ export const MQTTProvider: React.FC<{ children: React.ReactNode }> = ({ children
 
     mqttClient.on('message', (topic, message) => {
       const payload = message.toString();
+      // One timestamp per message, shared by the log, device states and sensor data
+      const receivedAt = new Date();
       // Always record raw message in the log (newest first)
       setMessageLog(prev => {
-        const next = [{ topic, payload, receivedAt: new Date() }, ...prev];
+        const next = [{ topic, payload, receivedAt }, ...prev];
         return next.slice(0, 200);
       });
 
-      // Process messages for office/{roomId} topic format
-      setDeviceStates(prev => {
-        const next = { ...prev };
+      const parts = topic.split('/');
+
+      // New room JSON format: office/{roomId}. Parse once here rather than inside the state updaters,
+      // which React may run more than once
+      let roomPayload: Record<string, unknown> | null = null;
+      if (parts[0] === 'office' && parts.length === 2) {
         try {
-          const parts = topic.split('/');
-          if (parts[0] === 'office' && parts.length === 2) {
-            // New room JSON format: office/{roomId}
-            const roomId = parts[1];
-            try {
-              const obj = JSON.parse(payload);
-              // Parse each device state from JSON
-              Object.entries(obj).forEach(([deviceType, value]) => {
-                // Map device types to consistent state keys
-                const stateKey = `office/${roomId}/${deviceType}/state`;
-                const stringValue = String(value);
-                next[stateKey] = { 
-                  state: stringValue, 
-                  lastUpdate: new Date() 
-                };
-              });
-              
-              // Also store the raw topic for debugging
-              next[topic] = { state: payload, lastUpdate: new Date() };
-              
-              // Update sensor data for charts
-              setSensorData(prev => {
-                const next = { ...prev };
-                const timestamp = new Date();
-                
-                // Update sensor data arrays
-                Object.entries(obj).forEach(([sensorType, value]) => {
-                  if (['temperature', 'humidity', 'co2', 'tvoc'].includes(sensorType)) {
-                    const numValue = Number(value);
-                    if (!isNaN(numValue)) {
-                      // Add new data point with type assertion
-                      const typedSensorType = sensorType as keyof typeof next;
-                      next[typedSensorType] = [
-                        ...next[typedSensorType].slice(-29), // Keep last 30 points
-                        { timestamp, value: numValue }
-                      ];
-                      
-                      console.log(`📊 [SENSOR_DATA] Updated ${sensorType}: ${numValue}`);
-                    }
-                  }
-                });
-                
-                return next;
-              });
-              
-              // Update current sensor values
-              setCurrentSensorValues(prev => {
-                const next = { ...prev };
-                
-                Object.entries(obj).forEach(([sensorType, value]) => {
-                  if (['temperature', 'humidity', 'co2', 'tvoc'].includes(sensorType)) {
-                    const numValue = Number(value);
-                    if (!isNaN(numValue)) {
-                      const typedSensorType = sensorType as keyof typeof next;
-                      next[typedSensorType] = numValue;
-                      console.log(`🌡️ [CURRENT_SENSOR] Updated ${sensorType}: ${numValue}`);
-                    }
-                  }
-                });
-                
-                return next;
-              });
-              
-            } catch (parseError) {
-              // Store raw payload if JSON parsing fails
-              next[topic] = { state: payload, lastUpdate: new Date() };
-            }
-          } else if (parts.length >= 4 && parts[0] === 'office') {
-            // Legacy format: office/{room}/{device}/{subtopic}
-            const base = parts.slice(0, 3).join('/'); // e.g. office/room1/light
-            const sub = parts.slice(3).join('/'); // remainder
-            if (sub === 'set' || sub === 'control' || sub === 'state' || sub === 'status') {
-              next[`${base}/state`] = { state: payload, lastUpdate: new Date() };
-            } else {
-              // sensor or other topic under device: keep raw topic key
-              next[topic] = { state: payload, lastUpdate: new Date() };
+          const parsed = JSON.parse(payload);
+          if (parsed !== null && typeof parsed === 'object') {
+            roomPayload = parsed;
+          }
+        } catch (parseError) {
+          // Not JSON: the raw payload is stored below
+        }
+      }
+
+      // Collect sensor readings in a single pass so charts and current values are updated together
+      const readings: Array<[SensorMetric, number]> = [];
+      if (roomPayload) {
+        Object.entries(roomPayload).forEach(([sensorType, value]) => {
+          // Sensor keys come from SENSOR_METRICS, so the payload and the charts/gauges share one list
+          if (isSensorMetric(sensorType)) {
+            const numValue = Number(value);
+            if (!isNaN(numValue)) {
+              readings.push([sensorType, numValue]);
             }
+          }
+        });
+      }
+
+      setDeviceStates(prev => {
+        const next = { ...prev };
+        if (roomPayload) {
+          const roomId = parts[1];
+          // Map each device in the JSON to a consistent state key
+          Object.entries(roomPayload).forEach(([deviceType, value]) => {
+            next[`office/${roomId}/${deviceType}/state`] = { state: String(value), lastUpdate: receivedAt };
+          });
+          // Also store the raw topic for debugging
+          next[topic] = { state: payload, lastUpdate: receivedAt };
+        } else if (parts.length >= 4 && parts[0] === 'office') {
+          // Legacy format: office/{room}/{device}/{subtopic}
+          const base = parts.slice(0, 3).join('/'); // e.g. office/room1/light
+          const sub = parts.slice(3).join('/'); // remainder
+          if (DEVICE_STATE_SUBTOPICS.has(sub)) {
+            next[`${base}/state`] = { state: payload, lastUpdate: receivedAt };
           } else {
-            // Non-office topics: store raw
-            next[topic] = { state: payload, lastUpdate: new Date() };
+            // sensor or other topic under device: keep raw topic key
+            next[topic] = { state: payload, lastUpdate: receivedAt };
           }
-        } catch (e) {
-          console.error('Error processing MQTT message:', e);
-          // Fallback: store raw
-          next[topic] = { state: payload, lastUpdate: new Date() };
+        } else {
+          // Non-office topics and non-JSON room payloads: store raw
+          next[topic] = { state: payload, lastUpdate: receivedAt };
         }
         return next;
       });
+
+      if (readings.length === 0) return;
+
+      // Update sensor data for charts
+      setSensorData(prev => {
+        const next = { ...prev };
+        readings.forEach(([sensorType, value]) => {
+          next[sensorType] = [
+            ...next[sensorType].slice(-29), // Keep last 30 points
+            { timestamp: receivedAt, value }
+          ];
+        });
+        return next;
+      });
+
+      // Update current sensor values
+      setCurrentSensorValues(prev => {
+        const next = { ...prev };
+        readings.forEach(([sensorType, value]) => {
+          next[sensorType] = value;
+        });
+        return next;
+      });
+
+      if (MQTT_DEBUG) {
+        readings.forEach(([sensorType, value]) => {
+          console.log(`📊 [SENSOR_DATA] Updated ${sensorType}: ${value}`);
+        });
+      }
     });
 
     mqttClient.on('error', (err) => {
@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, lazy, Suspense } from 'react';
 import {
   Grid,
   Container,
@@ -21,35 +21,20 @@ import CombinedChart from '../components/CombinedChart';
 import SensorChart from '../components/SensorChart';
 import MQTTInspector from '../components/MQTTInspector';
 import MQTTTester from '../components/MQTTTester';
-import TemperatureGauge from '../components/TemperatureGauge';
-import HumidityGauge from '../components/HumidityGauge';
-import CO2Gauge from '../components/CO2Gauge';
-import TVOCGauge from '../components/TVOCGauge';
-import TemperatureChart from '../components/TemperatureChart';
-import HumidityChart from '../components/HumidityChart';
-import CO2Chart from '../components/CO2Chart';
-import TVOCChart from '../components/TVOCChart';
-import Palette from '../components/Palette';
-import Canvas from '../components/Canvas';
-import SettingsPanel from '../components/SettingsPanel';
+import MetricGauge from '../components/MetricGauge';
+import MetricChart from '../components/MetricChart';
 import { BaseWidget, RoomLayout, WorkspaceState, WidgetType } from '../types/widgets';
 import { loadWorkspace, saveWorkspace, upsertRoom, setCurrentRoom } from '../utils/storage';
+import { generateDummyData } from '../utils/dummyData';
 import { useMQTT } from '../contexts/MQTTContext';
 import DownloadIcon from '@mui/icons-material/Download';
 import FullscreenIcon from '@mui/icons-material/Fullscreen';
 import NavigateNextIcon from '@mui/icons-material/NavigateNext';
 
-const generateDummyData = (baseValue: number, range: number, count: number) => {
-  const data = [];
-  let currentDate = new Date();
-  for (let i = count - 1; i >= 0; i--) {
-    data.push({
-      timestamp: new Date(currentDate.getTime() - i * 60000),
-      value: baseValue + (Math.random() - 0.5) * range,
-    });
-  }
-  return data;
-};
+// Designer-only components are split into their own chunk and loaded when the Designer tab is first opened
+const Palette = lazy(() => import('../components/Palette'));
+const Canvas = lazy(() => import('../components/Canvas'));
+const SettingsPanel = lazy(() => import('../components/SettingsPanel'));
 
 const rooms = [
   { id: 'room1', label: 'Room 1' },
@@ -158,15 +143,21 @@ const Dashboard: React.FC = () => {
   }, [sensorData.humidity]);
 
   // Fallback: Update dummy data every minute if no MQTT data
+  // Depend on the "has data" flags rather than array lengths so the timer isn't
+  // torn down and recreated on every incoming sample, and stop it entirely once
+  // both series are live.
+  const hasTempData = sensorData.temperature.length > 0;
+  const hasHumidityData = sensorData.humidity.length > 0;
   useEffect(() => {
+    if (hasTempData && hasHumidityData) return;
     const interval = setInterval(() => {
-      if (sensorData.temperature.length === 0) {
+      if (!hasTempData) {
         setTempData(prev => [...prev.slice(1), {
           timestamp: new Date(),
           value: prev[prev.length - 1].value + (Math.random() - 0.5) * 0.5,
         }]);
       }
-      if (sensorData.humidity.length === 0) {
+      if (!hasHumidityData) {
         setHumidityData(prev => [...prev.slice(1), {
           timestamp: new Date(),
           value: prev[prev.length - 1].value + (Math.random() - 0.5) * 2,
@@ -174,7 +165,7 @@ const Dashboard: React.FC = () => {
       }
     }, 60000);
     return () => clearInterval(interval);
-  }, [sensorData.temperature.length, sensorData.humidity.length]);
+  }, [hasTempData, hasHumidityData]);
 
   return (
     <Box sx={{ flexGrow: 1, bgcolor: '#f5f5f5', minHeight: '100vh', display: 'flex', flexDirection: 'column' }}>
@@ -226,10 +217,10 @@ const Dashboard: React.FC = () => {
             <Grid item xs={12} lg={2}>
               <Grid container spacing={3}>
                 <Grid item xs={12}>
-                  <TemperatureGauge />
+                  <MetricGauge metric="temperature" />
                 </Grid>
                 <Grid item xs={12}>
-                  <CO2Gauge />
+                  <MetricGauge metric="co2" />
                 </Grid>
               </Grid>
             </Grid>
@@ -248,10 +239,10 @@ const Dashboard: React.FC = () => {
                   </StyledPaper>
                 </Grid>
                 <Grid item xs={12}>
-                  <HumidityGauge />
+                  <MetricGauge metric="humidity" />
                 </Grid>
                 <Grid item xs={12}>
-                  <TVOCGauge />
+                  <MetricGauge metric="tvoc" />
                 </Grid>
                 <Grid item xs={12}>
                   <StyledPaper>
@@ -299,51 +290,53 @@ const Dashboard: React.FC = () => {
             </Grid>
 
             <Grid item xs={12} md={6}>
-              <TemperatureChart />
+              <MetricChart metric="temperature" />
             </Grid>
 
             <Grid item xs={12} md={6}>
-              <HumidityChart />
+              <MetricChart metric="humidity" />
             </Grid>
 
             <Grid item xs={12} md={6}>
-              <CO2Chart />
+              <MetricChart metric="co2" />
             </Grid>
 
             <Grid item xs={12} md={6}>
-              <TVOCChart />
+              <MetricChart metric="tvoc" />
             </Grid>
           </Grid>
         </Container>
       )}
       {activeTab === 'designer' && (
-        <Box sx={{ display: 'flex', width: '100%', mt: '112px', flex: 1 }}>
-          <Palette
-            rooms={workspace.rooms}
-            currentRoomId={workspace.currentRoomId}
-            onCreateRoom={createRoom}
-            onSelectRoom={selectRoom}
-            onAddWidget={addWidget}
-          />
-          <Box sx={{ flex: 1, display: 'flex', minWidth: 0 }}>
-            <Box sx={{ flex: 1, p: 2, minWidth: 0 }}>
-              {currentRoom ? (
-                <Canvas widgets={currentRoom.widgets} onChange={updateWidgets} onSelect={setSelectedWidget} />
-              ) : (
-                <Container maxWidth="md" sx={{ mt: 4 }}>
-                  <Typography variant="h6" color="text.secondary">Create or select a room to start designing</Typography>
-                </Container>
-              )}
-            </Box>
-            <Box sx={{ width: 320, borderLeft: 1, borderColor: 'divider', bgcolor: 'background.paper' }}>
-              <SettingsPanel widget={selectedWidget} onChange={(w) => {
-                if (!currentRoom) return;
-                const next = currentRoom.widgets.map(x => x.id === w.id ? w : x);
-                updateWidgets(next);
-              }} />
+        <Suspense fallback={null}>
+          <Box sx={{ display: 'flex', width: '100%', mt: '112px', flex: 1 }}>
+            <Palette
+              rooms={workspace.rooms}
+              currentRoomId={workspace.currentRoomId}
+              onCreateRoom={createRoom}
+              onSelectRoom={selectRoom}
+              onAddWidget={addWidget}
+            />
+            <Box sx={{ flex: 1, display: 'flex', minWidth: 0 }}>
+              <Box sx={{ flex: 1, p: 2, minWidth: 0 }}>
+                {currentRoom ? (
+                  <Canvas widgets={currentRoom.widgets} onChange={updateWidgets} onSelect={setSelectedWidget} />
+                ) : (
+                  <Container maxWidth="md" sx={{ mt: 4 }}>
+                    <Typography variant="h6" color="text.secondary">Create or select a room to start designing</Typography>
+                  </Container>
+                )}
+              </Box>
+              <Box sx={{ width: 320, borderLeft: 1, borderColor: 'divider', bgcolor: 'background.paper' }}>
+                <SettingsPanel widget={selectedWidget} onChange={(w) => {
+                  if (!currentRoom) return;
+                  const next = currentRoom.widgets.map(x => x.id === w.id ? w : x);
+                  updateWidgets(next);
+                }} />
+              </Box>
             </Box>
           </Box>
-        </Box>
+        </Suspense>
       )}
     </Box>
   );
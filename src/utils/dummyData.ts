@@ -0,0 +1,17 @@
+export interface DataPoint {
+  timestamp: Date;
+  value: number;
+}
+
+// Placeholder series (one point per minute, ending now) shown until real MQTT data arrives
+export function generateDummyData(baseValue: number, range: number, count: number): DataPoint[] {
+  const data: DataPoint[] = [];
+  const currentDate = new Date();
+  for (let i = count - 1; i >= 0; i--) {
+    data.push({
+      timestamp: new Date(currentDate.getTime() - i * 60000),
+      value: baseValue + (Math.random() - 0.5) * range,
+    });
+  }
+  return data;
+}
@@ -0,0 +1,73 @@
+import { SensorMetric } from '../contexts/MQTTContext';
+
+export interface SensorMetricSpec {
+  title: string;
+  icon: string;
+  unit: string;
+  // Word units are separated from the value ("400 ppm"); symbol units are attached ("25°C")
+  spacedUnit: boolean;
+  chart: {
+    color: string;
+    // Centre and spread of the placeholder series when no value has been received yet
+    fallbackValue: number;
+    dummyRange: number;
+  };
+  gauge: {
+    min: number;
+    max: number;
+    decimals: number;
+    // [low, high] thresholds and the colours used below, between and above them
+    thresholds: [number, number];
+    colors: [string, string, string];
+  };
+}
+
+export const SENSOR_METRICS: Record<SensorMetric, SensorMetricSpec> = {
+  temperature: {
+    title: 'Temperature',
+    icon: '🌡️',
+    unit: '°C',
+    spacedUnit: false,
+    chart: { color: '#ff6b6b', fallbackValue: 25, dummyRange: 3 },
+    gauge: { min: 10, max: 40, decimals: 1, thresholds: [20, 30], colors: ['#2196f3', '#4caf50', '#f44336'] },
+  },
+  humidity: {
+    title: 'Humidity',
+    icon: '💧',
+    unit: '%',
+    spacedUnit: false,
+    chart: { color: '#4dabf7', fallbackValue: 60, dummyRange: 10 },
+    gauge: { min: 0, max: 100, decimals: 1, thresholds: [30, 70], colors: ['#ff9800', '#4caf50', '#2196f3'] },
+  },
+  co2: {
+    title: 'CO2',
+    icon: '🌫️',
+    unit: 'ppm',
+    spacedUnit: true,
+    chart: { color: '#7c4dff', fallbackValue: 400, dummyRange: 100 },
+    gauge: { min: 0, max: 2000, decimals: 0, thresholds: [400, 1000], colors: ['#4caf50', '#ff9800', '#f44336'] },
+  },
+  tvoc: {
+    title: 'TVOC',
+    icon: '🧪',
+    unit: 'ppm',
+    spacedUnit: true,
+    chart: { color: '#26a69a', fallbackValue: 0.5, dummyRange: 0.1 },
+    gauge: { min: 0, max: 2, decimals: 3, thresholds: [0.3, 1.0], colors: ['#4caf50', '#ff9800', '#f44336'] },
+  },
+};
+
+export function isSensorMetric(key: string): key is SensorMetric {
+  return Object.prototype.hasOwnProperty.call(SENSOR_METRICS, key);
+}
+
+export function formatWithUnit(value: number | string, spec: SensorMetricSpec): string {
+  return spec.spacedUnit ? `${value} ${spec.unit}` : `${value}${spec.unit}`;
+}
+
+// Symbol units go on both bounds ("10°C - 40°C"), word units only once ("0 - 2000 ppm")
+export function formatRange(min: number, max: number, spec: SensorMetricSpec): string {
+  return spec.spacedUnit
+    ? `${min} - ${formatWithUnit(max, spec)}`
+    : `${formatWithUnit(min, spec)} - ${formatWithUnit(max, spec)}`;
+}